@@ -38,6 +38,11 @@ from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from typing import Any, Optional
 
+try:  # RapidFuzz computes the same ratio in C, 20-100x faster than difflib.
+    from rapidfuzz import fuzz
+except ImportError:  # pragma: no cover - optional dependency
+    fuzz = None  # type: ignore
+
 
 def standardize(text: Optional[str]) -> str:
     """Normalize a string for fuzzy comparison.
@@ -71,11 +76,18 @@ def standardize(text: Optional[str]) -> str:
 
 
 def similarity(a: str, b: str) -> float:
-    """Compute similarity ratio between two standardized strings."""
+    """Compute similarity ratio between two standardized strings.
+
+    Uses RapidFuzz when installed and falls back to the pure-Python
+    ``difflib.SequenceMatcher`` otherwise; both return the normalized
+    indel ratio in ``[0, 1]``.
+    """
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
     return SequenceMatcher(None, a, b).ratio()
 
 
@@ -224,29 +236,36 @@ class FuzzyMatcher:
         candidates: list[MatchCandidate],
         tier_def: dict,
     ) -> Optional[MatchResult]:
+        # Single O(N) pass keeping only the running best; the MatchResult
+        # (and its rounding) is built once for the winner instead of for
+        # every interim improvement.
+        weights = tier_def["weights"]
+        min_title = tier_def.get("min_title_sim", 0.0)
         best_score = 0.0
-        best_result: Optional[MatchResult] = None
+        best_candidate: Optional[MatchCandidate] = None
+        best_components: dict[str, float] = {}
 
         for candidate in candidates:
-            score, components = self.score_candidate(
-                query, candidate, tier_def["weights"]
-            )
+            score, components = self.score_candidate(query, candidate, weights)
 
-            min_title = tier_def.get("min_title_sim", 0.0)
             if min_title and components.get("title", 0) < min_title:
                 continue
 
             if score > best_score and score >= self.min_score:
                 best_score = score
-                best_result = MatchResult(
-                    candidate=candidate,
-                    score=round(score, 4),
-                    tier=tier_def["tier"],
-                    tier_name=tier_def["name"],
-                    component_scores={k: round(v, 4) for k, v in components.items()},
-                )
-
-        return best_result
+                best_candidate = candidate
+                best_components = components
+
+        if best_candidate is None:
+            return None
+
+        return MatchResult(
+            candidate=best_candidate,
+            score=round(best_score, 4),
+            tier=tier_def["tier"],
+            tier_name=tier_def["name"],
+            component_scores={k: round(v, 4) for k, v in best_components.items()},
+        )
 
     @staticmethod
     def _query_has_fields(query: MatchQuery, required: list[str]) -> bool:
@@ -13,7 +13,13 @@ try:  # ``python-dotenv`` is optional.
 except ImportError:  # pragma: no cover - optional dependency
     load_dotenv = None  # type: ignore
 
-from musicbrainz_downloader import PostgresConfig, download_and_prepare
+from musicbrainz_downloader import (
+    CORE_DUMP_FILES,
+    FULL_DUMP_FILES,
+    DumpConfig,
+    PostgresConfig,
+    download_and_prepare,
+)
 from musicbrainz_parser import MusicBrainzParser, ParserConfig
 from spotify_enricher import SpotifyConfig, SpotifyEnricher
 
@@ -23,7 +29,7 @@ def build_argument_parser() -> argparse.ArgumentParser:
         description="Bob Dylan song and cover analysis pipeline",
     )
 
-    parser.add_argument("--data-dir", default="data", help="Directory for CSV exports")
+    parser.add_argument("--data-dir", default="data", help="Directory for exported datasets (Parquet by default; see --output-format)")
     parser.add_argument("--artist", default="Bob Dylan", help="Artist name to analyse")
     parser.add_argument("--log-level", default="INFO", help="Logging level")
 
@@ -31,6 +37,9 @@ def build_argument_parser() -> argparse.ArgumentParser:
     refresh.add_argument("--refresh-db", action="store_true", help="Download and import MusicBrainz dump")
     refresh.add_argument("--skip-verify", action="store_true", help="Skip checksum verification when downloading dumps")
     refresh.add_argument("--overwrite-downloads", action="store_true", help="Re-download dump archives even if they exist")
+    refresh.add_argument("--jobs", default=None, type=int, help="Parallel psql workers for the data import phase (default: CPU count)")
+    refresh.add_argument("--full-dump", action="store_true", help="Also download the derived and stats archives (default: core mbdump only)")
+    refresh.add_argument("--parallel-parts", default=1, type=int, help="HTTP range connections per dump file (default: 1, single stream)")
     refresh.add_argument("--use-docker", dest="use_docker", action="store_true", help="Run PostgreSQL inside Docker (default)")
     refresh.add_argument("--no-docker", dest="use_docker", action="store_false", help="Use a locally installed PostgreSQL instance")
     refresh.set_defaults(use_docker=True)
@@ -43,6 +52,7 @@ def build_argument_parser() -> argparse.ArgumentParser:
     mb_parser = parser.add_argument_group("MusicBrainz parsing")
     mb_parser.add_argument("--get-covers", action="store_true", help="Extract works, recordings and covers from MusicBrainz")
     mb_parser.add_argument("--db-url", default=None, help="SQLAlchemy database URL for MusicBrainz")
+    mb_parser.add_argument("--output-format", default="parquet", choices=("parquet", "csv"), help="Export format for works/recordings/covers (parquet needs pyarrow)")
 
     spotify = parser.add_argument_group("Spotify enrichment")
     spotify.add_argument("--enrich-spotify", action="store_true", help="Fetch Spotify popularity for cover tracks")
@@ -97,15 +107,25 @@ def main(argv: Optional[list[str]] = None) -> None:
             password=args.db_password,
             database=args.db_name,
         )
+        dump_config = DumpConfig(
+            files=list(FULL_DUMP_FILES) if args.full_dump else list(CORE_DUMP_FILES),
+            parallel_parts=args.parallel_parts,
+        )
         download_and_prepare(
             verify=not args.skip_verify,
             overwrite=args.overwrite_downloads,
             use_docker=args.use_docker,
             postgres_config=postgres_config,
+            dump_config=dump_config,
+            jobs=args.jobs,
         )
 
     if args.get_covers:
-        parser_config = ParserConfig(artist_name=args.artist, data_dir=data_dir)
+        parser_config = ParserConfig(
+            artist_name=args.artist,
+            data_dir=data_dir,
+            output_format=args.output_format,
+        )
         mb_parser = MusicBrainzParser(parser_config=parser_config, db_url=args.db_url)
         mb_parser.run()
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import base64
+import json
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,12 +15,49 @@ from typing import Optional
 import pandas as pd
 import requests
 
+try:  # ``orjson`` decodes API responses ~3-5x faster than stdlib ``json``.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # ``requests-cache`` is optional; without it lookups are in-memory only.
+    from requests_cache import CachedSession
+except ImportError:  # pragma: no cover - optional dependency
+    CachedSession = None  # type: ignore
+
 from fuzzy_matcher import FuzzyMatcher, MatchCandidate, MatchQuery, standardize
 
 
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(content: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Explicit column types for the covers dataset.  Passing these to
+# ``pd.read_csv`` skips the type-inference pass and keeps string columns in
+# compact Arrow storage instead of Python objects.
+COVERS_SCHEMA: dict[str, str] = {
+    "work_id": "string[pyarrow]",
+    "work_title": "string[pyarrow]",
+    "recording_id": "string[pyarrow]",
+    "recording_title": "string[pyarrow]",
+    "recording_length_ms": "Int64",
+    "artist_names": "string[pyarrow]",
+    "artist_ids": "string[pyarrow]",
+    "is_bob_dylan": "boolean",
+    "release_id": "string[pyarrow]",
+    "release_title": "string[pyarrow]",
+    "first_release_date": "string[pyarrow]",
+    "isrcs": "string[pyarrow]",
+    "cover_artist_name": "string[pyarrow]",
+    "cover_artist_ids": "string[pyarrow]",
+}
+
+
 @dataclass
 class SpotifyConfig:
     """Configuration for interacting with the Spotify Web API."""
@@ -32,6 +71,11 @@ class SpotifyConfig:
     data_dir: Path = Path("data")
     covers_filename: str = "dylan_covers.csv"
     output_filename: str = "dylan_covers_with_popularity.csv"
+    # Lifetime of persisted Spotify search responses; 0 disables the disk cache.
+    cache_expire_seconds: int = 30 * 24 * 60 * 60
+    # Fetch the access token during construction so the first lookup does not
+    # pay the auth round-trip.  Off by default to keep __init__ network-free.
+    prewarm_token: bool = False
 
 
 class SpotifyEnricher:
@@ -42,30 +86,73 @@ class SpotifyEnricher:
         self.data_dir = Path(config.data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        self.session = requests.Session()
+        # A sqlite-backed HTTP cache makes re-runs after a crash near free.
+        # Only GET is cached so the client-credentials token POST always hits
+        # the network, and requests-cache keys on URL+params (not headers), so
+        # rotated bearer tokens still reuse cached search responses.
+        if CachedSession is not None and config.cache_expire_seconds > 0:
+            self.session: requests.Session = CachedSession(
+                str(self.data_dir / "spotify_cache.sqlite"),
+                backend="sqlite",
+                expire_after=config.cache_expire_seconds,
+                allowable_methods=("GET",),
+            )
+        else:
+            self.session = requests.Session()
+        # Keep-alive pool sized for search plus token traffic so repeated
+        # lookups reuse warm TLS connections.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.matcher = FuzzyMatcher(min_score=config.min_match_score)
 
         self._token: Optional[str] = None
         self._token_expiry: float = 0.0
+        self._token_lock = threading.Lock()
         self._cache: dict[tuple[str, str], dict[str, object]] = {}
 
+        if config.prewarm_token:
+            try:
+                self._ensure_token()
+            except requests.RequestException as exc:
+                logger.warning("Spotify token pre-warm failed, will retry on first request: %s", exc)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def enrich(self, covers_path: Optional[Path] = None, output_path: Optional[Path] = None) -> pd.DataFrame:
-        """Load cover data, enrich it with Spotify popularity and export to CSV."""
+        """Load cover data, enrich it with Spotify popularity and export it.
+
+        Both CSV and Parquet inputs are supported; when the configured covers
+        file is missing the sibling with the other extension is tried, and the
+        output is written in the same format as the input.
+        """
 
         covers_path = covers_path or (self.data_dir / self.config.covers_filename)
         output_path = output_path or (self.data_dir / self.config.output_filename)
 
         if not covers_path.exists():
-            raise FileNotFoundError(
-                f"Cover dataset {covers_path} does not exist. Run the MusicBrainz parser first."
+            sibling = covers_path.with_suffix(
+                ".parquet" if covers_path.suffix == ".csv" else ".csv"
             )
+            if sibling.exists():
+                covers_path = sibling
+            else:
+                raise FileNotFoundError(
+                    f"Cover dataset {covers_path} does not exist. Run the MusicBrainz parser first."
+                )
+
+        if covers_path.suffix == ".parquet":
+            covers_df = pd.read_parquet(covers_path)
+            output_path = output_path.with_suffix(".parquet")
+        else:
+            covers_df = pd.read_csv(covers_path, dtype=COVERS_SCHEMA)
 
-        covers_df = pd.read_csv(covers_path)
         enriched_df = self.enrich_dataframe(covers_df)
-        enriched_df.to_csv(output_path, index=False)
+        if output_path.suffix == ".parquet":
+            enriched_df.to_parquet(output_path, compression="zstd", index=False)
+        else:
+            enriched_df.to_csv(output_path, index=False)
         logger.info("Exported Spotify enriched covers to %s", output_path)
         return enriched_df
 
@@ -73,44 +160,89 @@ class SpotifyEnricher:
         if covers_df.empty:
             return covers_df.copy()
 
-        enriched_rows = []
+        def _col(name: str) -> pd.Series:
+            if name in covers_df.columns:
+                return covers_df[name].astype("string").replace("", pd.NA)
+            return pd.Series(pd.NA, index=covers_df.index, dtype="string")
+
+        # Vectorised query-field extraction; missing titles fall back to the
+        # work title and missing cover artists to the raw credit string.
+        titles = _col("recording_title").fillna(_col("work_title"))
+        artists = _col("cover_artist_name").fillna(_col("artist_names"))
+        albums = _col("release_title")
+        years = pd.to_numeric(
+            _col("first_release_date").str.slice(0, 4), errors="coerce"
+        ).astype("Int64")
+
+        # Many covers share a (title, artist) pair across releases, so run
+        # one Spotify lookup per unique standardized pair and fan the results
+        # back onto the frame with a single merge - no per-row dict loop.
+        jobs = pd.DataFrame(
+            {
+                "_std_title": titles.map(standardize, na_action="ignore").fillna(""),
+                "_std_artist": artists.map(standardize, na_action="ignore").fillna(""),
+                "title": titles,
+                "artist": artists,
+                "album": albums,
+                "year": years,
+            }
+        )
+        unique_jobs = jobs.loc[titles.notna()].drop_duplicates(
+            subset=["_std_title", "_std_artist"]
+        )
+
+        total = len(unique_jobs)
+        logger.info(
+            "Enriching %d rows via %d unique (title, artist) lookups",
+            len(covers_df), total,
+        )
+
         failed_count = 0
-        for idx, row in enumerate(covers_df.to_dict(orient="records"), 1):
-            row = dict(row)
+        result_rows: list[dict[str, object]] = []
+        for idx, (std_title, std_artist, title, artist, album, year) in enumerate(
+            unique_jobs.itertuples(index=False, name=None), 1
+        ):
             if idx % 100 == 0:
-                logger.info("Progress: %d/%d (%d failed)", idx, len(covers_df), failed_count)
-
-            title = row.get("recording_title") or row.get("work_title")
-            artist_name = row.get("cover_artist_name") or row.get("artist_names")
-            album = row.get("release_title")
-            if not isinstance(album, str):
-                album = None
-            year = None
-            release_date = row.get("first_release_date")
-            if release_date and isinstance(release_date, str) and len(release_date) >= 4:
-                try:
-                    year = int(release_date[:4])
-                except ValueError:
-                    pass
+                logger.info("Progress: %d/%d lookups (%d failed)", idx, total, failed_count)
 
-            try:
-                if title and len(title) > 200:
-                    logger.warning("Skipping long title: %s...", title[:100])
-                    enriched_rows.append(row)
-                    failed_count += 1
-                    continue
+            if len(title) > 200:
+                logger.warning("Skipping long title: %s...", title[:100])
+                continue
+            artist = artist if isinstance(artist, str) else None
+            album = album if isinstance(album, str) else None
+            year = int(year) if pd.notna(year) else None
 
-                spotify_info = self.lookup_track(title, artist_name, album=album, year=year)
-                if spotify_info:
-                    row.update(spotify_info)
+            try:
+                match = self.lookup_track(title, artist, album=album, year=year)
             except (requests.RequestException, ValueError, KeyError) as e:
-                logger.warning("Failed to enrich '%s' by '%s': %s", title, artist_name, e)
+                logger.warning("Failed to enrich '%s' by '%s': %s", title, artist, e)
                 failed_count += 1
+                continue
 
-            enriched_rows.append(row)
+            if match:
+                result_rows.append(
+                    {"_std_title": std_title, "_std_artist": std_artist, **match}
+                )
 
-        logger.info("Enrichment complete: %d total, %d failed/skipped", len(enriched_rows), failed_count)
-        return pd.DataFrame(enriched_rows)
+        logger.info(
+            "Enrichment complete: %d total, %d matched keys, %d failed lookups",
+            len(covers_df), len(result_rows), failed_count,
+        )
+        if not result_rows:
+            return covers_df.copy()
+
+        enriched_df = (
+            covers_df.assign(
+                _std_title=jobs["_std_title"], _std_artist=jobs["_std_artist"]
+            )
+            .merge(
+                pd.DataFrame(result_rows),
+                on=["_std_title", "_std_artist"],
+                how="left",
+            )
+            .drop(columns=["_std_title", "_std_artist"])
+        )
+        return enriched_df
 
     # ------------------------------------------------------------------
     # Spotify interactions
@@ -147,7 +279,7 @@ class SpotifyEnricher:
         for search_q in search_queries:
             params = {"q": search_q, "type": "track", "limit": 10, "market": self.config.market}
             response = self._request("GET", "https://api.spotify.com/v1/search", params=params)
-            data = response.json()
+            data = _json_loads(response.content)
             for item in data.get("tracks", {}).get("items", []):
                 track_id = item.get("id")
                 if track_id in seen_ids:
@@ -251,6 +383,12 @@ class SpotifyEnricher:
             return response
 
     def _ensure_token(self) -> None:
+        # The lock makes concurrent callers safe: only one thread refreshes
+        # while the rest wait and then see the fresh token.
+        with self._token_lock:
+            self._ensure_token_locked()
+
+    def _ensure_token_locked(self) -> None:
         now = time.time()
         if self._token and now < self._token_expiry - 30:
             return
@@ -268,7 +406,7 @@ class SpotifyEnricher:
             logger.error("Spotify authentication failed: %s", response.text)
             response.raise_for_status()
 
-        payload = response.json()
+        payload = _json_loads(response.content)
         self._token = payload["access_token"]
         self._token_expiry = time.time() + payload.get("expires_in", 3600)
         logger.info("Obtained Spotify access token")
@@ -290,5 +428,5 @@ def load_config_from_env(data_dir: Path | str = Path("data")) -> SpotifyConfig:
     )
 
 
-__all__ = ["SpotifyConfig", "SpotifyEnricher", "load_config_from_env"]
+__all__ = ["COVERS_SCHEMA", "SpotifyConfig", "SpotifyEnricher", "load_config_from_env"]
 